@@ -50,6 +50,8 @@ a = Analysis(
         'tkinter',
         'rich',
         'rich.console',
+        'rich.errors',
+        'rich.markup',
         'rich.table',
         'rich.panel',
         'rich.progress',
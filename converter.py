@@ -18,10 +18,16 @@ Author: RiceChen_
 Version: 1.4.6
 """
 
+import copy
 import json
 import os
+import posixpath
+import queue
 import shutil
+import threading
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from rich.console import Console
 from rich.table import Table
@@ -37,6 +43,11 @@ from rich.progress import (
     TransferSpeedColumn,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Global variables
 CURRENT_LANG = "zh"
 console = Console()
@@ -160,9 +171,21 @@ TRANSLATIONS = {
     },
 }
 
-def get_text(key, *args):
-    """Get translated text"""
-    text = TRANSLATIONS.get(key, {}).get(CURRENT_LANG, f"Missing translation: {key}")
+@lru_cache(maxsize=None)
+def _translation(key, lang):
+    """Look up the unformatted text for key in lang, memoized"""
+    return TRANSLATIONS.get(key, {}).get(lang, f"Missing translation: {key}")
+
+def get_text(key, *args, lang=None):
+    """
+    Get translated text
+    
+    Args:
+        key (str): Translation key
+        *args: Values substituted into the text
+        lang (str, optional): Language code; defaults to CURRENT_LANG
+    """
+    text = _translation(key, lang or CURRENT_LANG)
     return text.format(*args) if args else text
 
 def get_progress_bar():
@@ -1493,7 +1516,13 @@ def process_mixed_damage_models(json_data, output_path):
         with open(file_name, 'w', encoding='utf-8') as f:
             json.dump(new_json, f, indent=4)
 
-def convert_item_model_format(json_data, output_path, input_path=""):
+def _write_json_file(file_name, data):
+    """Write JSON data to disk, creating parent directories as needed"""
+    os.makedirs(os.path.dirname(file_name), exist_ok=True)
+    with open(file_name, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4)
+
+def convert_item_model_format(json_data, output_path, input_path="", write_json=None):
     """
     Convert JSON format for Item Model mode with comprehensive handling of all model types
     
@@ -1501,10 +1530,14 @@ def convert_item_model_format(json_data, output_path, input_path=""):
         json_data (dict): Original JSON data containing model overrides
         output_path (str): Base path for output files
         input_path (str): Original input file path for type detection
+        write_json (callable, optional): Called as write_json(file_name, data) for
+            each generated file; defaults to writing the file to disk
     """
     if "overrides" not in json_data or not json_data["overrides"]:
         return None
 
+    write_json = write_json or _write_json_file
+
     # Check if this is a fishing rod
     if is_fishing_rod_model(json_data, input_path):
         # Group overrides by custom_model_data
@@ -1567,12 +1600,8 @@ def convert_item_model_format(json_data, output_path, input_path=""):
                 # If no namespace, handle as a regular path
                 file_name = os.path.join(output_path, normal_model + ".json")
 
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(file_name), exist_ok=True)
-
             # Write the JSON file
-            with open(file_name, 'w', encoding='utf-8') as f:
-                json.dump(new_json, f, indent=4)
+            write_json(file_name, new_json)
                 
         return
 
@@ -1642,8 +1671,6 @@ def convert_item_model_format(json_data, output_path, input_path=""):
         else:
             file_name = os.path.join(output_path, model_path + ".json")
 
-        os.makedirs(os.path.dirname(file_name), exist_ok=True)
-
         # Handle shield
         if is_shield_model(json_data, input_path):
             new_json = {
@@ -1848,8 +1875,50 @@ def convert_item_model_format(json_data, output_path, input_path=""):
             new_json["display"] = json_data["display"]
 
         # Write the output file
-        with open(file_name, 'w', encoding='utf-8') as f:
-            json.dump(new_json, f, indent=4)
+        write_json(file_name, new_json)
+
+def convert_model_for_mode(json_data, mode, file_path=""):
+    """
+    Convert a model file's data if the given mode applies to it
+    
+    Args:
+        json_data (dict): Parsed model JSON
+        mode (str): Conversion mode - "cmd", "damage" or "item_model"
+        file_path (str): Model file path, used for model type detection
+        
+    Returns:
+        dict: Converted data, or None if the file needs no conversion
+    """
+    # Determine if file needs conversion based on mode
+    should_convert = False
+    if mode == "damage":
+        # Pure damage mode: only process files with damage predicates
+        should_convert = is_damage_model(json_data)
+    elif mode == "cmd":
+        # Custom Model Data mode:
+        # - Process files with custom_model_data
+        # - Process files with both custom_model_data and damage
+        should_convert = (
+            "overrides" in json_data and 
+            any(
+                "custom_model_data" in o.get("predicate", {}) or
+                (
+                    "custom_model_data" in o.get("predicate", {}) and
+                    "damage" in o.get("predicate", {})
+                )
+                for o in json_data.get("overrides", [])
+            )
+        )
+
+    if not should_convert:
+        return None
+
+    # Convert based on mode
+    if mode == "damage":
+        # Pure damage mode conversion
+        return convert_damage_model(json_data)
+    # CMD or Item Model mode conversion
+    return convert_json_format(json_data, mode == "item_model", file_path)
 
 def process_directory(input_dir, output_dir, mode="cmd"):
     """Process directory in specified mode
@@ -1869,6 +1938,7 @@ def process_directory(input_dir, output_dir, mode="cmd"):
     
     # Copy all files first
     for root, dirs, files in os.walk(input_dir):
+        dirs[:] = [d for d in dirs if d != '.git']
         relative_path = os.path.relpath(root, input_dir)
         output_root = os.path.join(output_dir, relative_path)
         os.makedirs(output_root, exist_ok=True)
@@ -1900,7 +1970,8 @@ def process_directory(input_dir, output_dir, mode="cmd"):
                          if f.lower().endswith('.json')]
     # Other modes: process all JSON files
     else:
-        for root, _, files in os.walk(input_dir):
+        for root, dirs, files in os.walk(input_dir):
+            dirs[:] = [d for d in dirs if d != '.git']
             for file in files:
                 if file.lower().endswith('.json'):
                     json_files.append(os.path.join(root, file))
@@ -1915,36 +1986,8 @@ def process_directory(input_dir, output_dir, mode="cmd"):
                 with open(json_file, 'r', encoding='utf-8') as f:
                     json_data = json.load(f)
 
-                # Determine if file needs conversion based on mode
-                should_convert = False
-                if mode == "damage":
-                    # Pure damage mode: only process files with damage predicates
-                    should_convert = is_damage_model(json_data)
-                elif mode == "cmd":
-                    # Custom Model Data mode:
-                    # - Process files with custom_model_data
-                    # - Process files with both custom_model_data and damage
-                    should_convert = (
-                        "overrides" in json_data and 
-                        any(
-                            "custom_model_data" in o.get("predicate", {}) or
-                            (
-                                "custom_model_data" in o.get("predicate", {}) and
-                                "damage" in o.get("predicate", {})
-                            )
-                            for o in json_data.get("overrides", [])
-                        )
-                    )
-
-                if should_convert:
-                    # Convert based on mode
-                    if mode == "damage":
-                        # Pure damage mode conversion
-                        converted_data = convert_damage_model(json_data)
-                    else:
-                        # CMD or Item Model mode conversion
-                        converted_data = convert_json_format(json_data, mode == "item_model", json_file)
-                    
+                converted_data = convert_model_for_mode(json_data, mode, json_file)
+                if converted_data is not None:
                     # Write converted data
                     output_file = os.path.join(output_dir, relative_path)
                     with open(output_file, 'w', encoding='utf-8') as f:
@@ -1986,6 +2029,7 @@ def process_directory_item_model(input_dir, output_dir):
     
     # First copy all files to maintain complete structure
     for root, dirs, files in os.walk(input_dir):
+        dirs[:] = [d for d in dirs if d != '.git']
         relative_path = os.path.relpath(root, input_dir)
         output_root = os.path.join(output_dir, relative_path)
         os.makedirs(output_root, exist_ok=True)
@@ -2093,6 +2137,233 @@ def process_directory_item_model(input_dir, output_dir):
     
     return processed_files
 
+# Archive paths used when rewriting the folder structure in memory
+MODELS_ITEM_ARC = "assets/minecraft/models/item/"
+ITEMS_ARC = "assets/minecraft/items/"
+
+def iter_files(root):
+    """
+    Recursively yield file entries below root, skipping .git directories
+    
+    Uses os.scandir so the file/directory checks reuse the data from the
+    directory read instead of issuing a separate stat call per entry.
+    
+    Args:
+        root (str): Directory to walk
+    
+    Yields:
+        os.DirEntry: Entry for each regular file
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != '.git':
+                    yield from iter_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+def _list_files(input_dir):
+    """
+    List files below a directory as (arcname, entry) pairs, skipping .git
+    
+    Args:
+        input_dir (str): Directory to walk
+        
+    Returns:
+        list: (arcname, os.DirEntry) tuples with '/'-separated archive names
+    """
+    prefix_len = len(os.path.join(input_dir, ''))
+    return [(entry.path[prefix_len:].replace(os.sep, '/'), entry)
+            for entry in iter_files(input_dir)]
+
+def _move_entry(tree, src, dst):
+    """
+    Move an entry inside an in-memory output tree
+    
+    Mirrors the on-disk moves in adjust_folder_structure and
+    process_directory_item_model: an existing destination is kept as .bak.
+    """
+    if dst in tree:
+        tree[f"{dst}.bak"] = tree.pop(dst)
+    tree[dst] = tree.pop(src)
+
+def _load_json(path):
+    """
+    Parse a JSON file from raw bytes, using orjson when it is installed
+    
+    orjson rejects some input the json module accepts (NaN, integers wider
+    than 64 bits), so such files are parsed again with json.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+def _dump_json(data):
+    """Serialize JSON data exactly as the on-disk writers do"""
+    return json.dumps(data, indent=4).encode('utf-8')
+
+# Below this many model files a process pool costs more than it saves:
+# converting one file takes well under a millisecond, while spawning the
+# workers takes around a second
+PROCESS_POOL_MIN_FILES = 5000
+
+# ProcessPoolExecutor rejects more workers than this on Windows
+PROCESS_POOL_MAX_WORKERS = 61
+
+def _convert_one(job):
+    """
+    Convert a single model file for process_directory_streaming
+    
+    Runs in worker processes, so errors are returned instead of printed.
+    
+    Args:
+        job (tuple): (path, mode) of the model file to convert
+        
+    Returns:
+        tuple: (converted bytes or None if unchanged, error message or None)
+    """
+    path, mode = job
+    try:
+        json_data = _load_json(path)
+        converted_data = convert_model_for_mode(json_data, mode, path)
+        if converted_data is None:
+            return None, None
+        return _dump_json(converted_data), None
+    except Exception as e:
+        return None, str(e)
+
+def _map_conversions(jobs, max_workers=None):
+    """
+    Yield _convert_one results in job order
+    
+    Large batches are spread across a process pool; small ones, or a
+    max_workers of 1 or less, run in the current process. Workers are always
+    spawned rather than forked, since the caller may be running Tk and other
+    threads.
+    """
+    if not max_workers or max_workers <= 1 or len(jobs) < PROCESS_POOL_MIN_FILES:
+        yield from map(_convert_one, jobs)
+        return
+
+    import multiprocessing
+    workers = min(max_workers, PROCESS_POOL_MAX_WORKERS)
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        # A few chunks per worker keeps IPC low while balancing the load
+        chunksize = max(1, len(jobs) // (workers * 4))
+        yield from executor.map(_convert_one, jobs, chunksize=chunksize)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def process_directory_streaming(input_dir, mode="cmd", max_workers=None, lang=None):
+    """
+    Convert a directory and yield the resulting files as ZIP entries
+    
+    Produces the same files that process_directory (plus adjust_folder_structure)
+    or process_directory_item_model would leave in an output directory, without
+    writing that directory. Folder moves are applied to archive names in memory.
+    
+    Args:
+        input_dir (str): Input directory containing files to process
+        mode (str): Conversion mode - "cmd", "damage" or "item"
+        max_workers (int, optional): Worker processes for converting model
+            files in "cmd" and "damage" mode; converts in-process if omitted
+        lang (str, optional): Language for messages; defaults to CURRENT_LANG
+        
+    Yields:
+        tuple: (arcname, source) where source is the input os.DirEntry for
+            files that are copied unchanged, or bytes for converted JSON
+    """
+    files = _list_files(input_dir)
+    entries = dict(files)
+
+    # Output arcname -> input arcname (unchanged file) or bytes (generated file)
+    tree = {arc_name: arc_name for arc_name, _ in files}
+
+    def is_direct_model_item(arc_name):
+        return (arc_name.startswith(MODELS_ITEM_ARC)
+                and '/' not in arc_name[len(MODELS_ITEM_ARC):])
+
+    if mode == "item":
+        # Only JSON files directly in models/item are moved and converted
+        for arc_name, entry in files:
+            if not (is_direct_model_item(arc_name) and arc_name.lower().endswith('.json')):
+                continue
+
+            file = arc_name[len(MODELS_ITEM_ARC):]
+            dst_arc = ITEMS_ARC + file
+            _move_entry(tree, arc_name, dst_arc)
+
+            if hasattr(console, 'status_label'):
+                console.print(get_text("current_file", file, lang=lang))
+
+            def write_json(file_name, data):
+                gen_arc = posixpath.normpath(file_name.replace(os.sep, '/'))
+                if not gen_arc.startswith('../'):
+                    tree[gen_arc] = _dump_json(data)
+
+            try:
+                json_data = _load_json(entry.path)
+
+                needs_conversion = (
+                    "overrides" in json_data and 
+                    any("custom_model_data" in o.get("predicate", {}) 
+                        for o in json_data.get("overrides", []))
+                )
+
+                if needs_conversion:
+                    convert_item_model_format(json_data, ITEMS_ARC.rstrip('/'), file, write_json)
+                    # The original model is replaced by the generated files
+                    del tree[dst_arc]
+
+            except json.JSONDecodeError as e:
+                console.print(f"[red]{get_text('error_occurred', f'Invalid JSON in {file}: {str(e)}', lang=lang)}[/red]")
+            except Exception as e:
+                console.print(f"[red]{get_text('error_occurred', str(e), lang=lang)}[/red]")
+    else:
+        # Files directly in models/item move to items after conversion
+        for arc_name, _ in files:
+            if is_direct_model_item(arc_name):
+                _move_entry(tree, arc_name, ITEMS_ARC + arc_name[len(MODELS_ITEM_ARC):])
+
+    def needs_model_conversion(source):
+        return mode != "item" and isinstance(source, str) and source.lower().endswith('.json')
+
+    # Model files are converted in order of appearance, possibly in parallel
+    jobs = [(entries[source].path, mode) for source in tree.values() if needs_model_conversion(source)]
+    results = _map_conversions(jobs, max_workers)
+
+    try:
+        with get_progress_bar() as progress:
+            task = progress.add_task(get_text("processing_files", lang=lang), total=len(tree))
+
+            for out_arc, source in tree.items():
+                if isinstance(source, bytes):
+                    yield out_arc, source
+                    progress.update(task, advance=1)
+                    continue
+
+                data = entries[source]
+                if needs_model_conversion(source):
+                    converted, error = next(results)
+                    if error is not None:
+                        console.print(f"[red]{get_text('error_occurred', error, lang=lang)}[/red]")
+                    elif converted is not None:
+                        data = converted
+
+                yield out_arc, data
+                progress.update(task, advance=1)
+    finally:
+        results.close()
+
 def create_file_table(processed_files):
     """Create report table"""
     table = Table(
@@ -2168,6 +2439,138 @@ def adjust_folder_structure(base_dir):
             
             console.print(f"[green]{get_text('moved_models', models_item_path, items_path)}[/green]")
 
+# Already-compressed formats that DEFLATE cannot shrink; stored as-is
+STORED_EXTENSIONS = {'.png', '.ogg', '.jpg', '.jpeg', '.zip', '.jar', '.webp'}
+
+def zip_compression(arc_name):
+    """
+    Choose the compression method for a ZIP entry
+    
+    Minecraft reads resource packs with Java's ZIP implementation, which only
+    supports STORED and DEFLATE entries, so newer methods such as Zstandard
+    cannot be used here. Already-compressed assets are stored to skip a
+    DEFLATE pass that would not reduce their size.
+    
+    Args:
+        arc_name (str): Entry name inside the archive
+        
+    Returns:
+        int: zipfile compression constant
+    """
+    if posixpath.splitext(arc_name)[1].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+# Entries buffered between the converting thread and the ZIP writer
+ZIP_QUEUE_SIZE = 64
+
+# Marks the end of a _prefetch queue
+_END = object()
+
+def _prefetch(entries, maxsize=ZIP_QUEUE_SIZE):
+    """
+    Iterate entries on a background thread, buffering up to maxsize items
+    
+    Lets conversion run ahead while the caller compresses. Exceptions raised
+    while producing entries are re-raised in the caller; closing the returned
+    generator stops the producer and closes entries.
+    
+    Args:
+        entries (iterable): Items to produce
+        maxsize (int): Maximum number of items buffered at once
+        
+    Yields:
+        Items of entries, in order
+    """
+    items = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def produce():
+        error = None
+        try:
+            for item in entries:
+                if stop.is_set():
+                    break
+                items.put((item, None))
+        except BaseException as e:
+            error = e
+        finally:
+            close = getattr(entries, 'close', None)
+            if close is not None:
+                close()
+            items.put((_END, error))
+
+    producer = threading.Thread(target=produce, name="zip-producer", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is _END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        # Unblock a producer waiting on a full queue, then let it finish
+        stop.set()
+        while True:
+            try:
+                items.get_nowait()
+            except queue.Empty:
+                break
+        producer.join()
+
+# Buffer size for copying files into and out of ZIP archives
+ZIP_COPY_BUFFER = 1 << 20
+
+# Shared header fields for every ZIP entry. The fixed timestamp keeps the
+# output reproducible: the same input pack always gives the same archive.
+_ZIP_INFO_TEMPLATE = zipfile.ZipInfo('', date_time=(1980, 1, 1, 0, 0, 0))
+_ZIP_INFO_TEMPLATE.external_attr = 0o644 << 16
+
+def _zip_info(arc_name, compress_type, file_size=0):
+    """
+    Create the ZipInfo for an entry from the shared template
+    
+    Args:
+        arc_name (str): '/'-separated entry name inside the archive
+        compress_type (int): zipfile compression constant
+        file_size (int): Uncompressed size, used to decide on ZIP64 up front
+        
+    Returns:
+        zipfile.ZipInfo: Header for the entry
+    """
+    info = copy.copy(_ZIP_INFO_TEMPLATE)
+    info.filename = arc_name
+    info.compress_type = compress_type
+    info.file_size = file_size
+    return info
+
+def _write_file_entry(zipf, source, arc_name, compress_type, buf):
+    """
+    Copy a file into an open ZIP archive through a caller-owned buffer
+    
+    Unlike ZipFile.write, which allocates a new chunk for every read, the
+    file is read into buf with readinto so one allocation serves all entries.
+    
+    Args:
+        zipf (zipfile.ZipFile): Archive opened for writing
+        source (str | os.PathLike): File to copy; an os.DirEntry's cached
+            stat is reused for the size
+        arc_name (str): '/'-separated entry name inside the archive
+        compress_type (int): zipfile compression constant
+        buf (bytearray): Reusable read buffer
+    """
+    st = source.stat() if isinstance(source, os.DirEntry) else os.stat(source)
+    info = _zip_info(arc_name, compress_type, st.st_size)
+    view = memoryview(buf)
+    with open(source, 'rb') as src, zipf.open(info, 'w', force_zip64=False) as dst:
+        while True:
+            n = src.readinto(buf)
+            if not n:
+                break
+            dst.write(view[:n])
+
 def create_zip(folder_path, zip_path):
     """Create ZIP archive"""
     total_files = sum(len(files) for _, _, files in os.walk(folder_path))
@@ -2177,14 +2580,46 @@ def create_zip(folder_path, zip_path):
     with get_progress_bar() as progress:
         task = progress.add_task(get_text("compressing_files"), total=total_files)
         
+        buf = bytearray(ZIP_COPY_BUFFER)
         with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
             for root, _, files in os.walk(folder_path):
                 for file in files:
                     file_path = os.path.join(root, file)
-                    arc_name = os.path.relpath(file_path, folder_path)
-                    zipf.write(file_path, arc_name)
+                    arc_name = os.path.relpath(file_path, folder_path).replace(os.sep, '/')
+                    _write_file_entry(zipf, file_path, arc_name, zip_compression(arc_name), buf)
                     progress.update(task, advance=1)
 
+def create_zip_streaming(entries, zip_path, lang=None):
+    """
+    Create a ZIP archive from entries as they are produced
+    
+    Args:
+        entries (iterable): (arcname, source) pairs, where source is a file
+            path, an os.DirEntry or the file contents as bytes
+        zip_path (str): Output ZIP file path
+        lang (str, optional): Language for messages; defaults to CURRENT_LANG
+    """
+    console.print(f"\n[cyan]{get_text('creating_zip', lang=lang)}[/cyan]")
+    
+    buf = bytearray(ZIP_COPY_BUFFER)
+    # Entries are produced on a background thread; the ZipFile is only
+    # touched from this one
+    queued = _prefetch(entries)
+    try:
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as zipf:
+            for arc_name, source in queued:
+                compress_type = zip_compression(arc_name)
+                if isinstance(source, bytes):
+                    zipf.writestr(_zip_info(arc_name, compress_type), source)
+                else:
+                    _write_file_entry(zipf, source, arc_name, compress_type, buf)
+    except BaseException:
+        queued.close()
+        # Do not leave a truncated archive behind
+        if os.path.exists(zip_path):
+            os.remove(zip_path)
+        raise
+
 def main(lang="zh"):
     """Main program entry point"""
     global CURRENT_LANG
@@ -19,19 +19,20 @@ Version: 1.4.6
 
 import sys
 import os
+import io
 import shutil
-import zipfile
 import tempfile
 import errno
+import queue
 import stat
-from datetime import datetime
+import time
+import itertools
+from concurrent.futures import ThreadPoolExecutor, wait
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import converter
 import json
+import re
 import threading
-from rich.console import Console
-import subprocess
 import tkinter as tk
 from tkinter import ttk, filedialog
 
@@ -256,6 +257,13 @@ TRANSLATIONS = {
     }
 }
 
+# Per-language lookup tables built once at import, so each lookup is a single dict access
+LANG_CACHE = {
+    lang: {key: values.get(lang, f"Missing translation: {key}") for key, values in TRANSLATIONS.items()}
+    for lang in ("zh", "en", "es", "de")
+}
+_MISSING_TEXTS = {key: f"Missing translation: {key}" for key in TRANSLATIONS}
+
 def get_resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
@@ -264,6 +272,156 @@ def get_resource_path(relative_path):
     
     return os.path.join(base_path, relative_path)
 
+# Model file suffixes, matched without lowercasing every file name
+JSON_SUFFIXES = ('.json', '.JSON')
+
+def _cancel_and_wait(futures):
+    """
+    Stop a batch of pool tasks after one of them failed
+    
+    Tasks that have not started are cancelled and running ones are waited
+    for, so nothing keeps writing once the caller reports the error.
+    
+    Args:
+        futures (list): Futures submitted for the batch
+    """
+    for future in futures:
+        future.cancel()
+    wait(futures)
+
+def _zip_file_list(zip_path):
+    """
+    List the entries of a ZIP archive, excluding any .git directory
+    
+    Only the central directory is read; no entry is decompressed.
+    
+    Args:
+        zip_path (str): Path to the ZIP archive
+    
+    Returns:
+        list: Entry names in archive order
+    """
+    zipfile = _load_zipfile()
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        return [f for f in zip_ref.namelist() if not f.startswith('.git/')]
+
+# Characters ZipFile.extract replaces in names on Windows
+_WINDOWS_ILLEGAL_TABLE = str.maketrans(':<>|"?*', '_' * 7)
+
+def _member_path(input_dir, name):
+    """
+    Map a ZIP entry name to a destination path inside input_dir
+    
+    Follows the same rules as ZipFile.extract: drive letters and empty,
+    '.' and '..' components are dropped so entries cannot escape the
+    destination, and characters invalid on Windows are replaced.
+    
+    Args:
+        input_dir (str): Extraction root
+        name (str): ZIP entry name
+    
+    Returns:
+        str: Sanitized destination path
+    """
+    arcname = name.replace('/', os.sep)
+    if os.altsep:
+        arcname = arcname.replace(os.altsep, os.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [part for part in arcname.split(os.sep) if part not in ('', os.curdir, os.pardir)]
+    if os.sep == '\\':
+        parts = [part.translate(_WINDOWS_ILLEGAL_TABLE).rstrip('.') for part in parts]
+        parts = [part for part in parts if part]
+    return os.path.join(input_dir, *parts)
+
+def use_fast_zlib():
+    """
+    Swap zipfile's DEFLATE backend for isal or zlib-ng when installed
+    
+    Both libraries expose a zlib-compatible API with much faster DEFLATE.
+    The swap is verified with a ZIP round-trip and reverted if it fails.
+    
+    Returns:
+        bool: True if a faster backend is in use
+    """
+    import zipfile
+    try:
+        from isal import isal_zlib as fast_zlib
+    except ImportError:
+        try:
+            from zlib_ng import zlib_ng as fast_zlib
+        except ImportError:
+            return False
+
+    original_zlib = zipfile.zlib
+    zipfile.zlib = fast_zlib
+    try:
+        payload = b'{"parent": "item/generated"}' * 64
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+            zip_ref.writestr("check.json", payload)
+        with zipfile.ZipFile(buffer, 'r') as zip_ref:
+            if zip_ref.read("check.json") != payload:
+                raise ValueError("round-trip mismatch")
+    except Exception:
+        zipfile.zlib = original_zlib
+        return False
+    return True
+
+_zipfile_module = None
+
+def _load_zipfile():
+    """
+    Import zipfile on first use
+    
+    Deferred so the window does not wait on it at startup. The first call
+    also switches to a faster DEFLATE backend when one is installed.
+    
+    Returns:
+        module: The zipfile module
+    """
+    global _zipfile_module
+    if _zipfile_module is None:
+        import zipfile
+        use_fast_zlib()
+        _zipfile_module = zipfile
+    return _zipfile_module
+
+# Free space that must remain on the RAM disk after a pack is placed there
+RAM_SCRATCH_HEADROOM = 1 << 30
+
+def ram_scratch_root():
+    """
+    Find a RAM-backed directory for temporary working files
+    
+    Returns:
+        str or None: /dev/shm on Linux when it exists, otherwise None
+    """
+    shm = '/dev/shm'
+    if sys.platform.startswith('linux') and os.path.isdir(shm):
+        return shm
+    return None
+
+def _pack_size(input_path, is_zip):
+    """
+    Total uncompressed size of a selected pack, skipping .git
+    
+    For a ZIP only the central directory is read; a folder is walked.
+    
+    Args:
+        input_path (str): Selected ZIP file or folder
+        is_zip (bool): Whether input_path is a ZIP file
+    
+    Returns:
+        int: Size in bytes
+    """
+    if is_zip:
+        zipfile = _load_zipfile()
+        with zipfile.ZipFile(input_path, 'r') as zip_ref:
+            return sum(info.file_size for info in zip_ref.infolist()
+                       if not info.filename.startswith('.git/'))
+    import converter
+    return sum(entry.stat().st_size for entry in converter.iter_files(input_path))
+
 def get_text(key, lang):
     """
     Retrieve text in the specified language for a given key
@@ -275,17 +433,24 @@ def get_text(key, lang):
     Returns:
         str: Translated text or error message if translation not found
     """
-    return TRANSLATIONS.get(key, {}).get(lang, f"Missing translation: {key}")
+    try:
+        return LANG_CACHE[lang][key]
+    except KeyError:
+        return f"Missing translation: {key}"
+
+# Fallback for messages rich cannot parse as markup
+_RICH_TAG_RE = re.compile(r'\[/?(?:cyan|green|yellow|red|bold)\]')
 
-class GuiConsole(Console):
+class GuiConsole:
     """
     Custom console class for GUI integration
     
-    Extends rich.console.Console to provide GUI-specific functionality including
-    progress tracking and status updates through the GUI interface.
+    Stands in for rich.console.Console in the converter module, providing
+    progress tracking and status updates through the GUI interface. Only
+    print() is used by the converter, so no rich Console is constructed.
     """
     
-    def __init__(self, status_label, progress_bar, progress_var):
+    def __init__(self, status_label, progress_bar, progress_var, post_status, post_progress):
         """
         Initialize GUI console with Tkinter widgets
         
@@ -293,11 +458,14 @@ class GuiConsole(Console):
             status_label: Label widget for status messages
             progress_bar: Progressbar widget for progress display
             progress_var: Variable for progress tracking
+            post_status: Callable that schedules a status text update
+            post_progress: Callable that schedules a progress update
         """
-        super().__init__()
         self.status_label = status_label
         self.progress_bar = progress_bar
         self.progress_var = progress_var
+        self.post_status = post_status
+        self.post_progress = post_progress
         self.current_task = None
         self.total = 0
         self.completed = 0
@@ -312,12 +480,17 @@ class GuiConsole(Console):
             *args: Variable length argument list for message components
             **kwargs: Arbitrary keyword arguments
         """
-        message = " ".join(str(arg) for arg in args)
-        # Remove rich format tags
-        for tag in ['cyan', 'green', 'yellow', 'red', 'bold']:
-            message = message.replace(f'[{tag}]', '').replace(f'[/{tag}]', '')
+        from rich.errors import MarkupError
+        from rich.markup import render as render_markup
         
-        self.status_label.after(0, self.status_label.config, {"text": message})
+        # Let rich strip its own markup so any tag is handled
+        text = " ".join(map(str, args))
+        try:
+            message = render_markup(text).plain
+        except MarkupError:
+            message = _RICH_TAG_RE.sub('', text)
+        
+        self.post_status(message)
         
         # Reset progress for specific operations
         if any(x in message.lower() for x in ["processing files", "moving files", "compressing files"]):
@@ -327,7 +500,7 @@ class GuiConsole(Console):
         """Reset progress tracking variables and progress bar display"""
         self.completed = 0
         self.total = 0
-        self.progress_var.set(0)
+        self.post_progress(0)
 
     def update(self, completed=None, total=None, advance=1):
         """
@@ -347,7 +520,7 @@ class GuiConsole(Console):
 
         if self.total > 0:
             progress = (self.completed / self.total) * 100
-            self.progress_var.set(progress)
+            self.post_progress(progress)
 
 class CustomProgress:
     """
@@ -448,10 +621,66 @@ class ResourcePackConverter(tk.Tk):
         self.conversion_mode = tk.StringVar(value="cmd")
         self.processing = False
         
-        # Create temporary working directory
-        self.temp_dir = tempfile.mkdtemp(prefix="mcpack_")
+        # Selected ZIP archive whose extraction is deferred until conversion
+        self._pending_zip = None
+        
+        # Shared pool for per-file extraction/copy work only; the tasks that
+        # wait on it run on the job thread below, never inside the pool
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=max(4, (os.cpu_count() or 1) - 2),
+            thread_name_prefix="mcpack-io"
+        )
+        
+        # Input processing and conversions run one after another on a
+        # single long-lived thread
+        self._jobs = queue.Queue()
+        threading.Thread(
+            target=self._worker,
+            name="mcpack-jobs",
+            daemon=True
+        ).start()
+        
+        # Renamed-away directories waiting to be deleted by a single
+        # background thread, so resets never wait on per-file unlinks
+        self._trash = queue.Queue()
+        threading.Thread(
+            target=self._drain_trash,
+            name="mcpack-trash",
+            daemon=True
+        ).start()
+        
+        # Calls queued by worker threads for the Tk main loop, plus the
+        # latest progress/status values; all applied by _pump every 50 ms
+        self.ui_queue = queue.Queue()
+        self._pending_pct = None
+        self._shown_pct = None
+        self._pending_status = None
+        self._shown_status = None
+        
+        # Create temporary working directory, removed automatically when the
+        # object is finalized or the interpreter exits
+        self._tmp = tempfile.TemporaryDirectory(
+            prefix="mcpack_",
+            ignore_cleanup_errors=True
+        )
+        self.temp_dir = self._tmp.name
         os.chmod(self.temp_dir, stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO)
-        os.makedirs(os.path.join(self.temp_dir, "input"), exist_ok=True)
+        
+        # RAM-backed working directory, used for packs that fit (see
+        # place_input_dir)
+        ram_root = ram_scratch_root()
+        self._ram_tmp = None
+        if ram_root:
+            self._ram_tmp = tempfile.TemporaryDirectory(
+                prefix="mcpack_",
+                dir=ram_root,
+                ignore_cleanup_errors=True
+            )
+            os.chmod(self._ram_tmp.name, stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO)
+        
+        # Directory holding the selected pack's files
+        self.input_dir = os.path.join(self.temp_dir, "input")
+        os.makedirs(self.input_dir, exist_ok=True)
         
         # Set output directory from settings
         self.output_dir = self.settings.get('output_dir', os.path.join(self.program_dir, "output"))
@@ -459,8 +688,11 @@ class ResourcePackConverter(tk.Tk):
         # Create main frame and GUI elements
         self.setup_gui()
         
-        # Initialize console and converter
-        self.setup_console()
+        # Console and converter are set up on first conversion
+        self.gui_console = None
+        
+        # Start applying queued UI updates
+        self.after(50, self._pump)
 
     def load_settings(self):
         """Load settings from JSON file"""
@@ -495,22 +727,16 @@ class ResourcePackConverter(tk.Tk):
     def setup_directories(self):
         """Set up necessary program directories"""
         try:
-            # Create main program directory
-            if not os.path.exists(self.program_dir):
-                os.makedirs(self.program_dir)
-            
-            # Create input and output directories
+            # Create input and output directories (and the program directory with them)
             for dir_name in ['input', 'output']:
-                dir_path = os.path.join(self.program_dir, dir_name)
-                if not os.path.exists(dir_path):
-                    os.makedirs(dir_path)
+                os.makedirs(os.path.join(self.program_dir, dir_name), exist_ok=True)
                         
         except Exception as e:
             messagebox.showerror(
                 "Error",
                 f"Error while setting up directories: {str(e)}"
             )
-        sys.exit(1)
+            sys.exit(1)
 
     def setup_gui(self):
         """Set up the main GUI components"""
@@ -599,12 +825,14 @@ class ResourcePackConverter(tk.Tk):
         ]
         
         for mode, text_key in modes:
-            ttk.Radiobutton(
+            radio_button = ttk.Radiobutton(
                 self.mode_frame,
                 text=get_text(text_key, self.current_lang.get()),
                 variable=self.conversion_mode,
                 value=mode
-            ).pack(side=tk.LEFT, padx=20, pady=5)
+            )
+            radio_button.pack(side=tk.LEFT, padx=20, pady=5)
+            setattr(self, f"{text_key}_rb", radio_button)
 
     def create_mode_description(self):
         """Create a description section for conversion modes"""
@@ -693,8 +921,16 @@ class ResourcePackConverter(tk.Tk):
         selected_index = self.file_list.curselection()
         if selected_index:
             selected_file = self.file_list.get(selected_index)
-            file_path = os.path.join(os.path.join(self.temp_dir, "input"), selected_file)
+            input_dir = self.input_dir
+            file_path = os.path.join(input_dir, selected_file)
             
+            # Entries of a pending ZIP are extracted on demand
+            if self._pending_zip and not os.path.exists(file_path):
+                zipfile = _load_zipfile()
+                with zipfile.ZipFile(self._pending_zip, 'r') as zip_ref:
+                    file_path = zip_ref.extract(selected_file, input_dir)
+            
+            import subprocess
             if sys.platform == "win32":
                 os.startfile(file_path)
             elif sys.platform == "darwin":  # macOS
@@ -760,60 +996,121 @@ class ResourcePackConverter(tk.Tk):
         self.status_label.pack(pady=5, fill=tk.X)
 
     def setup_console(self):
-        """Initialize the console and converter components"""
-        self.gui_console = GuiConsole(
-            self.status_label,
-            self.progress_bar,
-            self.progress_var
-        )
-        converter.console = self.gui_console
-        converter.CustomProgress = CustomProgress
+        """
+        Import the converter and connect it to the GUI console
+        
+        Deferred until the first conversion to keep window startup fast.
+        
+        Returns:
+            module: The configured converter module
+        """
+        import converter
+        if self.gui_console is None:
+            _load_zipfile()
+            self.gui_console = GuiConsole(
+                self.status_label,
+                self.progress_bar,
+                self.progress_var,
+                self._post_status,
+                self._post_pct
+            )
+            converter.console = self.gui_console
+            converter.CustomProgress = CustomProgress
+        return converter
+
+    def _post_ui(self, func, *args):
+        """Queue a call to run on the Tk main loop from any thread"""
+        self.ui_queue.put((func, args))
+
+    def _post_pct(self, pct):
+        """
+        Set the progress bar value from any thread
+        
+        Only the latest value is kept, so bursts of per-file updates collapse
+        into at most one redraw per _pump cycle.
+        """
+        self._pending_pct = pct
+
+    def _post_status(self, text):
+        """Set the status label text from any thread, keeping only the latest text"""
+        self._pending_status = text
+
+    def _pump(self):
+        """Run queued UI calls and apply changed progress/status, then reschedule"""
+        try:
+            while True:
+                try:
+                    func, args = self.ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                func(*args)
+
+            pct = self._pending_pct
+            if pct is not None and pct != self._shown_pct:
+                self._shown_pct = pct
+                self.progress_var.set(pct)
+
+            status = self._pending_status
+            if status is not None and status != self._shown_status:
+                self._shown_status = status
+                self.status_label.config(text=status)
+        finally:
+            self.after(50, self._pump)
+
+    def set_progress_indeterminate(self, indeterminate):
+        """
+        Switch the progress bar between indeterminate and determinate mode
+        
+        Args:
+            indeterminate (bool): True to animate while the total is unknown
+        """
+        if indeterminate:
+            self.progress_bar.config(mode='indeterminate')
+            self.progress_bar.start(50)
+        else:
+            # stop() resets the bar, so re-apply the latest known progress
+            self.progress_bar.stop()
+            self.progress_bar.config(mode='determinate')
+            if self._pending_pct is not None:
+                self._shown_pct = self._pending_pct
+                self.progress_var.set(self._pending_pct)
 
     def update_language(self, *args):
         """Update all interface text when language is changed"""
         lang = self.current_lang.get()
+        t = LANG_CACHE.get(lang, _MISSING_TEXTS)
         
         # Update window and main labels
-        self.title(get_text("title", lang))
-        self.title_label.config(text=get_text("title", lang))
-        self.author_label.config(text=get_text("author", lang))
+        self.title(t["title"])
+        self.title_label.config(text=t["title"])
+        self.author_label.config(text=t["author"])
         
         # Update frame titles
-        self.lang_frame.config(text=get_text("language_selection", lang))
-        self.mode_frame.config(text=get_text("conversion_mode", lang))
-        self.list_frame.config(text=get_text("file_list", lang))
-        self.output_frame.config(text=get_text("output_folder", lang))
+        self.lang_frame.config(text=t["language_selection"])
+        self.mode_frame.config(text=t["conversion_mode"])
+        self.list_frame.config(text=t["file_list"])
+        self.output_frame.config(text=t["output_folder"])
         
         # Update mode description frame if it exists
         if hasattr(self, 'mode_desc_frame'):
-            self.mode_desc_frame.config(text=get_text("conversion_mode_description", lang))
+            self.mode_desc_frame.config(text=t["conversion_mode_description"])
         
         # Update button text
-        self.folder_btn.config(text=get_text("choose_folder", lang))
-        self.zip_btn.config(text=get_text("choose_zip", lang))
-        self.convert_btn.config(text=get_text("start_convert", lang))
-        self.clear_btn.config(text=get_text("clear_files", lang))
-        self.change_output_btn.config(text=get_text("change_output_folder", lang))
-        self.open_output_btn.config(text=get_text("open_output_folder", lang))
-        self.report_btn.config(text=get_text("report_issue", lang))
+        self.folder_btn.config(text=t["choose_folder"])
+        self.zip_btn.config(text=t["choose_zip"])
+        self.convert_btn.config(text=t["start_convert"])
+        self.clear_btn.config(text=t["clear_files"])
+        self.change_output_btn.config(text=t["change_output_folder"])
+        self.open_output_btn.config(text=t["open_output_folder"])
+        self.report_btn.config(text=t["report_issue"])
         
         # Update conversion mode radio buttons
-        modes = [
-            ("cmd", "mode_cmd"),
-            ("item", "mode_item"),
-            ("damage", "mode_damage")
-        ]
-        
-        for i, (mode, text_key) in enumerate(modes):
-            radio_button = self.mode_frame.winfo_children()[i]
-            if isinstance(radio_button, ttk.Radiobutton):
-                radio_button.config(text=get_text(text_key, lang))
+        self.mode_cmd_rb.config(text=t["mode_cmd"])
+        self.mode_item_rb.config(text=t["mode_item"])
+        self.mode_damage_rb.config(text=t["mode_damage"])
         
         # Update mode description
         self.update_mode_description()
-        
-        # Update converter module language
-        converter.CURRENT_LANG = lang
 
         # Save settings after language change
         self.save_settings()
@@ -836,6 +1133,7 @@ class ResourcePackConverter(tk.Tk):
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
             
+        import subprocess
         if sys.platform == "win32":
             os.startfile(self.output_dir)
         elif sys.platform == "darwin":  # macOS
@@ -848,12 +1146,11 @@ class ResourcePackConverter(tk.Tk):
         for btn in [self.folder_btn, self.zip_btn, self.convert_btn, self.clear_btn]:
             btn.state([state])
         
-        for radio_button in self.mode_frame.winfo_children():
-            if isinstance(radio_button, ttk.Radiobutton):
-                if state == 'disabled':
-                    radio_button.state(['disabled'])
-                else:
-                    radio_button.state(['!disabled'])
+        for radio_button in [self.mode_cmd_rb, self.mode_item_rb, self.mode_damage_rb]:
+            if state == 'disabled':
+                radio_button.state(['disabled'])
+            else:
+                radio_button.state(['!disabled'])
 
     def handle_remove_readonly(self, func, path, exc):
         """Handle removal of read-only files"""
@@ -864,68 +1161,229 @@ class ResourcePackConverter(tk.Tk):
         else:
             raise excvalue
 
+    def remove_tree_quietly(self, path):
+        """Remove a directory tree, fixing read-only files and ignoring leftovers"""
+        try:
+            shutil.rmtree(path, onerror=self.handle_remove_readonly)
+        except OSError:
+            pass
+
+    def _worker(self):
+        """Run queued jobs one at a time, forever"""
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            except Exception:
+                # Jobs report their own errors; keep the worker alive
+                pass
+
+    def _drain_trash(self):
+        """Delete queued trash directories one at a time, forever"""
+        while True:
+            self.remove_tree_quietly(self._trash.get())
+
+    def reset_dir(self, path):
+        """
+        Replace a directory with an empty one without waiting for the delete
+        
+        The old directory is renamed to a unique sibling and queued for the
+        background trash thread, so the caller only pays for one rename. If the
+        rename fails (e.g. a file inside is open on Windows) the directory
+        is removed in place instead.
+        
+        Args:
+            path (str): Directory to empty
+        """
+        if os.path.exists(path):
+            trash_dir = f"{path}.trash-{os.getpid()}-{time.time_ns()}"
+            try:
+                os.rename(path, trash_dir)
+            except OSError:
+                shutil.rmtree(path, onerror=self.handle_remove_readonly)
+            else:
+                self._trash.put(trash_dir)
+        os.makedirs(path)
+
+    def place_input_dir(self, input_path, is_zip):
+        """
+        Choose and create the input directory for a newly selected pack
+        
+        The RAM-backed directory is used only when its free space covers the
+        pack's uncompressed size plus RAM_SCRATCH_HEADROOM; otherwise the
+        pack goes to the disk-backed temp directory.
+        
+        Args:
+            input_path (str): Selected ZIP file or folder
+            is_zip (bool): Whether input_path is a ZIP file
+        
+        Returns:
+            str: The new input directory
+        """
+        input_dir = os.path.join(self.temp_dir, "input")
+        if self._ram_tmp is not None:
+            try:
+                free = shutil.disk_usage(self._ram_tmp.name).free
+                if _pack_size(input_path, is_zip) + RAM_SCRATCH_HEADROOM <= free:
+                    input_dir = os.path.join(self._ram_tmp.name, "input")
+            except OSError:
+                pass
+        os.makedirs(input_dir, exist_ok=True)
+        self.input_dir = input_dir
+        return input_dir
+
     def process_files_async(self, input_path, is_zip=False):
         """Process input files asynchronously"""
         try:
-            input_dir = os.path.join(self.temp_dir, "input")
-            if os.path.exists(input_dir):
-                shutil.rmtree(input_dir, onerror=self.handle_remove_readonly)
-            os.makedirs(input_dir)
+            self.reset_dir(self.input_dir)
+            input_dir = self.place_input_dir(input_path, is_zip)
 
             lang = self.current_lang.get()
             
             if is_zip:
-                self.status_label.config(text=get_text("extracting", lang))
-                with zipfile.ZipFile(input_path, 'r') as zip_ref:
-                    file_list = [f for f in zip_ref.namelist() 
-                                if not f.startswith('.git/')]
-                    total_files = len(file_list)
-                    for i, file in enumerate(file_list, 1):
-                        zip_ref.extract(file, input_dir)
-                        self.progress_var.set((i / total_files) * 100)
+                # Only the listing is needed now; extraction happens on conversion
+                self._pending_zip = input_path
             else:
-                self.status_label.config(text=get_text("copying_files", lang))
-                total_items = sum([len(files) for root, _, files in os.walk(input_path) 
-                                if '.git' not in root])
-                processed = 0
-                
-                for root, _, files in os.walk(input_path):
-                    if '.git' in root:
-                        continue
-                        
-                    for file in files:
-                        src_path = os.path.join(root, file)
-                        rel_path = os.path.relpath(src_path, input_path)
-                        dst_path = os.path.join(input_dir, rel_path)
-                        
-                        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-                        shutil.copy2(src_path, dst_path)
-                        
-                        processed += 1
-                        self.progress_var.set((processed / total_items) * 100)
+                self._pending_zip = None
+                self._post_status(get_text("copying_files", lang))
+                self.copy_folder(input_path, input_dir)
 
             # Update UI after processing
             self.update_file_list()
-            self.status_label.config(text="")
-            self.progress_var.set(0)
+            self._post_status("")
+            self._post_pct(0)
 
         except Exception as e:
-            self.after(0, messagebox.showerror, 
+            self._post_ui(messagebox.showerror, 
                       get_text("error", self.current_lang.get()), 
                       str(e))
         finally:
             self.processing = False
-            self.after(0, self.set_buttons_state, '!disabled')
+            self._post_ui(self.set_buttons_state, '!disabled')
+
+    def extract_zip(self, zip_path, file_list, input_dir):
+        """
+        Extract ZIP entries in parallel on the I/O thread pool
+        
+        ZipFile objects are not thread-safe, so each worker opens its own
+        handle to the archive. Entries are streamed to disk with a large
+        buffer instead of ZipFile.extract's 8 KiB chunks. Progress is posted
+        back to the Tk main loop.
+        
+        Args:
+            zip_path (str): Path to the ZIP archive
+            file_list (list): Entry names to extract
+            input_dir (str): Destination directory
+        """
+        total_files = len(file_list)
+        if total_files == 0:
+            return
+
+        import converter
+        zipfile = _load_zipfile()
+        local = threading.local()
+        handles = []
+        handles_lock = threading.Lock()
+        completed = itertools.count(1)
+
+        def _extract_one(name):
+            zip_ref = getattr(local, "zip_ref", None)
+            if zip_ref is None:
+                zip_ref = local.zip_ref = zipfile.ZipFile(zip_path, 'r')
+                with handles_lock:
+                    handles.append(zip_ref)
+            info = zip_ref.getinfo(name)
+            dst_path = _member_path(input_dir, name)
+            if info.is_dir():
+                os.makedirs(dst_path, exist_ok=True)
+            elif dst_path != input_dir:
+                os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+                with zip_ref.open(info) as src, open(dst_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, converter.ZIP_COPY_BUFFER)
+            self._post_pct((next(completed) / total_files) * 100)
+
+        futures = []
+        try:
+            for name in file_list:
+                futures.append(self._io_pool.submit(_extract_one, name))
+            for future in futures:
+                future.result()
+        except BaseException:
+            # Let no worker touch input_dir or open a handle after this
+            _cancel_and_wait(futures)
+            raise
+        finally:
+            for zip_ref in handles:
+                zip_ref.close()
+
+    def copy_folder(self, folder_path, input_dir):
+        """
+        Copy a folder tree into the input directory on the I/O thread pool
+        
+        The tree is walked once and each file is handed to a copy worker as
+        soon as it is found. The total is unknown until the walk finishes, so
+        the progress bar stays indeterminate until then.
+        
+        Args:
+            folder_path (str): Source folder selected by the user
+            input_dir (str): Destination directory
+        """
+        import converter
+        total_items = None
+        completed = itertools.count(1)
+
+        def _copy_one(src_path, dst_path):
+            shutil.copyfile(src_path, dst_path)
+            done = next(completed)
+            if total_items:
+                self._post_pct((done / total_items) * 100)
+
+        self._post_ui(self.set_progress_indeterminate, True)
+        futures = []
+        try:
+            created_dirs = set()
+            for entry in converter.iter_files(folder_path):
+                dst_path = os.path.join(input_dir, os.path.relpath(entry.path, folder_path))
+                dst_parent = os.path.dirname(dst_path)
+                if dst_parent not in created_dirs:
+                    os.makedirs(dst_parent, exist_ok=True)
+                    created_dirs.add(dst_parent)
+                futures.append(self._io_pool.submit(_copy_one, entry.path, dst_path))
+
+            total_items = len(futures)
+            self._post_ui(self.set_progress_indeterminate, False)
+            for future in futures:
+                future.result()
+        except BaseException:
+            _cancel_and_wait(futures)
+            raise
+        finally:
+            if total_items is None:
+                self._post_ui(self.set_progress_indeterminate, False)
 
     def update_file_list(self):
-        """Update the file list display"""
+        """
+        Update the file list display
+        
+        Paths are collected on the calling thread and handed to the Tk main
+        loop in one batch, so the listbox is filled with a single insert.
+        """
+        if self._pending_zip:
+            paths = [name for name in _zip_file_list(self._pending_zip)
+                     if name.endswith(JSON_SUFFIXES)]
+        else:
+            import converter
+            input_dir = self.input_dir
+            prefix_len = len(input_dir) + len(os.sep)
+            paths = [entry.path[prefix_len:] for entry in converter.iter_files(input_dir)
+                     if entry.name.endswith(JSON_SUFFIXES)]
+
+        self._post_ui(self._set_file_list, paths)
+
+    def _set_file_list(self, paths):
+        """Replace the listbox contents with one Tcl call"""
         self.file_list.delete(0, tk.END)
-        input_dir = os.path.join(self.temp_dir, "input")
-        for root, _, files in os.walk(input_dir):
-            for file in files:
-                if file.lower().endswith('.json'):
-                    rel_path = os.path.relpath(os.path.join(root, file), input_dir)
-                    self.file_list.insert(tk.END, rel_path)
+        self.file_list.insert(tk.END, *paths)
 
     def choose_folder(self):
         """Handle folder selection"""
@@ -938,10 +1396,7 @@ class ResourcePackConverter(tk.Tk):
         if folder:
             self.processing = True
             self.set_buttons_state('disabled')
-            threading.Thread(
-                target=self.process_files_async,
-                args=(folder, False)
-            ).start()
+            self._jobs.put(lambda: self.process_files_async(folder, False))
 
     def choose_zip(self):
         """Handle ZIP file selection"""
@@ -955,20 +1410,15 @@ class ResourcePackConverter(tk.Tk):
         if zip_file:
             self.processing = True
             self.set_buttons_state('disabled')
-            threading.Thread(
-                target=self.process_files_async,
-                args=(zip_file, True)
-            ).start()
+            self._jobs.put(lambda: self.process_files_async(zip_file, True))
 
     def clear_files(self):
         """Clear the input file list and temporary directory"""
         self.file_list.delete(0, tk.END)
-        input_dir = os.path.join(self.temp_dir, "input")
-        if os.path.exists(input_dir):
-            shutil.rmtree(input_dir, onerror=self.handle_remove_readonly)
-        os.makedirs(input_dir)
-        self.progress_var.set(0)
-        self.status_label.config(text="")
+        self._pending_zip = None
+        self.reset_dir(self.input_dir)
+        self._post_pct(0)
+        self._post_status("")
 
     def start_conversion(self):
         """Start the conversion process"""
@@ -985,83 +1435,65 @@ class ResourcePackConverter(tk.Tk):
             
         self.processing = True
         self.set_buttons_state('disabled')
-        threading.Thread(target=self.convert_files).start()
+        self._jobs.put(self.convert_files)
 
     def convert_files(self):
         """Execute the file conversion process"""
         try:
             lang = self.current_lang.get()
-            original_cwd = os.getcwd()
-            temp_output_dir = None
 
-            # Set converter language
-            converter.CURRENT_LANG = self.current_lang.get()
+            # Load the converter; messages use this run's language
+            converter = self.setup_console()
             
             # Create timestamp and output paths
+            from datetime import datetime
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_zip = f"converted_{timestamp}.zip"
             output_path = os.path.join(self.output_dir, output_zip)
             
             # Setup directories
-            temp_input_dir = os.path.join(self.temp_dir, "input")
-            temp_output_dir = os.path.join(self.temp_dir, "temp_output")
+            temp_input_dir = self.input_dir
             
-            # Change to temp directory
-            os.chdir(self.temp_dir)
+            # Extract a pending ZIP selection now that its files are needed
+            if self._pending_zip:
+                self._post_status(get_text("extracting", lang))
+                self.extract_zip(self._pending_zip, _zip_file_list(self._pending_zip), temp_input_dir)
+                self._pending_zip = None
+                self._post_pct(0)
             
             # Ensure output directory exists
-            if not os.path.exists(temp_output_dir):
-                os.makedirs(temp_output_dir)
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
-            try:
-                # Convert files based on selected mode
-                mode = self.conversion_mode.get()
-                if mode == "item":
-                    processed_files = converter.process_directory_item_model(temp_input_dir, temp_output_dir)
-                else:  # cmd or damage mode
-                    processed_files = converter.process_directory(temp_input_dir, temp_output_dir, mode)
-                    # Adjust folder structure (CMD and damage mode only)
-                    converter.adjust_folder_structure(temp_output_dir)
-                
-                # Ensure output directory exists
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                
-                # Create ZIP file
-                converter.create_zip(temp_output_dir, output_path)
-                
-                # Show completion message
-                if os.path.exists(output_path):
-                    self.after(0, messagebox.showinfo,
-                        get_text("complete", lang),
-                        get_text("conversion_complete", lang).format(output_zip)
-                    )
-                else:
-                    raise Exception(get_text("conversion_failed", lang).format(
-                        get_text("file_generation_failed", lang)
-                    ))
-                
-            finally:
-                # Restore original working directory
-                os.chdir(original_cwd)
+            # Convert files based on selected mode, streaming them straight
+            # into the output ZIP (folder moves are applied to entry names)
+            entries = converter.process_directory_streaming(
+                temp_input_dir, self.conversion_mode.get(),
+                max_workers=os.cpu_count(), lang=lang
+            )
+            converter.create_zip_streaming(entries, output_path, lang=lang)
+            
+            # Show completion message
+            if os.path.exists(output_path):
+                self._post_ui(messagebox.showinfo,
+                    get_text("complete", lang),
+                    get_text("conversion_complete", lang).format(output_zip)
+                )
+            else:
+                raise Exception(get_text("conversion_failed", lang).format(
+                    get_text("file_generation_failed", lang)
+                ))
             
         except Exception as e:
-            self.after(0, messagebox.showerror, 
+            self._post_ui(messagebox.showerror, 
                       get_text("error", lang), 
                       str(e))
             
         finally:
             # Cleanup and reset UI
             self.processing = False
-            self.progress_var.set(0)
-            self.status_label.config(text="")
-            self.after(0, self.set_buttons_state, '!disabled')
-            
-            # Remove temporary output directory
-            if temp_output_dir and os.path.exists(temp_output_dir):
-                try:
-                    shutil.rmtree(temp_output_dir, onerror=self.handle_remove_readonly)
-                except Exception:
-                    pass
+            self._post_pct(0)
+            self._post_status("")
+            self._post_ui(self.set_buttons_state, '!disabled')
 
     def on_closing(self):
         """Handle application closing"""
@@ -1083,11 +1515,12 @@ class ResourcePackConverter(tk.Tk):
             # Save settings before closing
             self.save_settings()
             
-            if os.path.exists(self.temp_dir):
-                try:
-                    shutil.rmtree(self.temp_dir, onerror=self.handle_remove_readonly)
-                except Exception:
-                    pass
+            # Drop queued I/O work so exit does not wait for it
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            
+            self._tmp.cleanup()
+            if self._ram_tmp is not None:
+                self._ram_tmp.cleanup()
             self.quit()
 
 def main():
@@ -1105,7 +1538,9 @@ def main():
     try:
         # Set UTF-8 encoding for Windows systems
         if sys.platform.startswith('win'):
-            os.system('chcp 65001')
+            import ctypes
+            ctypes.windll.kernel32.SetConsoleOutputCP(65001)
+            ctypes.windll.kernel32.SetConsoleCP(65001)
         
         # Create and run main application
         app = ResourcePackConverter()
@@ -1124,4 +1559,7 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Required for the converter's worker processes in frozen builds
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
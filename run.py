@@ -307,7 +307,8 @@ def find_convertible_files(directory):
     if not os.path.exists(directory):
         return convertible_files
     
-    for root, _, files in os.walk(directory):
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d != '.git']
         for file in files:
             if file.lower().endswith('.json'):
                 file_path = os.path.join(root, file)
@@ -558,7 +559,9 @@ if __name__ == "__main__":
     """
     # Set UTF-8 console encoding for Windows systems
     if sys.platform.startswith('win'):
-        os.system('chcp 65001')
+        import ctypes
+        ctypes.windll.kernel32.SetConsoleOutputCP(65001)
+        ctypes.windll.kernel32.SetConsoleCP(65001)
     
     # Display language selection prompt with bilingual options
     console.print(Panel(